@@ -13,6 +13,30 @@ from beets.util import PromptChoice
 TRACK_NAME_CONVENTION = {"en": "English", "ja-latn": "Romaji", "ja": "Japanese"}
 
 
+class NamePreference:
+    """
+    Pick the preferred name out of a VGMdb ``names`` dict according to a language priority.
+    Built once from the config and shared by the album, track, artist and publisher fields.
+    """
+
+    def __init__(self, priority: Sequence[str]):
+        self.priority = tuple(dict.fromkeys(priority))
+
+    def resolve(self, names: Dict[str, str], default: Optional[str] = None) -> Optional[str]:
+        """
+        :param names: mapping of language to name
+        :param default: returned when no prioritized language is present,
+                        falls back to the first name when None
+        :return: the name in the highest priority language available
+        """
+        for lang in self.priority:
+            if lang in names:
+                return names[lang]
+        if default is not None:
+            return default
+        return next(iter(names.values()), None)
+
+
 class VGMdbPlugin(BeetsPlugin):
     data_source = "VGMdb"  # MetadataSourcePlugin
 
@@ -35,6 +59,8 @@ class VGMdbPlugin(BeetsPlugin):
         self.source_weight = self.config["source_weight"].as_number()
         self.lang = self.config["lang-priority"].get().replace(" ", "").split(",")
         self.track_pref = [TRACK_NAME_CONVENTION[lang] for lang in self.lang]
+        self.name_preference = NamePreference(self.lang)
+        self.track_name_preference = NamePreference(self.track_pref)
         self.auto = self.config["autosearch"].get()
 
         self.register_listener("before_choose_candidate", self.before_choose_candidate_event)
@@ -53,17 +79,13 @@ class VGMdbPlugin(BeetsPlugin):
         if len(albuminfo.get(key, [])) > 0:
             self._log.info(f"Found {len(albuminfo[key])} {key}")
             artist_found = True
-            main_artist = list(albuminfo[key][0]["names"].values())[0]
+            main_artist = self.name_preference.resolve(albuminfo[key][0]["names"])
             main_artist_id = (
                 albuminfo[key][0]["link"].split("/")[1]
                 if "link" in albuminfo[key][0].keys()
                 else None
             )
-            for lan in self.lang:
-                if lan in albuminfo[key][0]["names"]:
-                    main_artist = albuminfo[key][0]["names"][lan]
-                    self._log.info(f"Final artist choice is {main_artist}")
-                    break
+            self._log.info(f"Final artist choice is {main_artist}")
             optional_album.update(self.format_list_of_person(albuminfo[key], key))
         else:
             self._log.info(f"{key} not found for this album.")
@@ -193,14 +215,9 @@ class VGMdbPlugin(BeetsPlugin):
                 else:
                     track_length = None
 
-                track_title = list(track["names"].values())[0]
-
-                for lang in self.track_pref:
-                    if lang in track["names"].keys():
-                        track_title = track["names"][lang]
-                        break
-                for lang in track["names"].keys():
-                    optional_args.update({f"vgmdb_track_name_{lang}": track["names"][lang]})
+                track_title = self.track_name_preference.resolve(track["names"])
+                for lang, name in track["names"].items():
+                    optional_args[f"vgmdb_track_name_{lang}"] = name
 
                 tracks.append(
                     TrackInfo(
@@ -240,14 +257,13 @@ class VGMdbPlugin(BeetsPlugin):
         out = {}
         if len(listofVGMPerson) > 0:
             if "names" in listofVGMPerson[0].keys():
-                for lang in listofVGMPerson[0]["names"].keys():
-                    out[f"{typeofPerson}_{lang}"] = ",".join(
-                        [
-                            person["names"][lang]
-                            for person in listofVGMPerson
-                            if lang in person["names"].keys()
-                        ]
-                    )
+                names_by_lang = {lang: [] for lang in listofVGMPerson[0]["names"]}
+                for person in listofVGMPerson:
+                    for lang, name in person["names"].items():
+                        if lang in names_by_lang:
+                            names_by_lang[lang].append(name)
+                for lang, names in names_by_lang.items():
+                    out[f"{typeofPerson}_{lang}"] = ",".join(names)
         return out
 
     def format_album_vgmdbinfo(self, albuminfo: Dict, url: Optional[str] = None) -> AlbumInfo:
@@ -264,11 +280,7 @@ class VGMdbPlugin(BeetsPlugin):
         tracks = self._format_track_info(albuminfo, url)
 
         # Album Name
-        album_name = albuminfo["name"]
-        for lang in self.lang:
-            if lang in albuminfo["names"].keys():
-                album_name = albuminfo["names"][lang]
-                break
+        album_name = self.name_preference.resolve(albuminfo["names"], default=albuminfo["name"])
 
         # Album VGMdb ID
         album_id = albuminfo["link"].split("/")[1]
@@ -299,14 +311,7 @@ class VGMdbPlugin(BeetsPlugin):
             albuminfo["publisher"] = { "link": {}, "names": {}, "role": {} }
             if "distributor" in albuminfo:
                 albuminfo["publisher"] = albuminfo["distributor"]
-        publisher = (
-            list(albuminfo["publisher"]["names"].values())[0]
-            if len(albuminfo["publisher"]["names"]) > 0
-            else None
-        )
-        for lang in self.lang:
-            if lang in albuminfo["publisher"]["names"].keys():
-                publisher = albuminfo["publisher"]["names"][lang]
+        publisher = self.name_preference.resolve(albuminfo["publisher"]["names"])
 
         return AlbumInfo(
             tracks=tracks,